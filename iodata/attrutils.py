@@ -73,6 +73,25 @@ def validate_shape(*shape_requirements: tuple) -> Callable:
        the expected size of the array being checked along axis ``i``.
 
     """
+    # When all requirements are static (an integer or None), the expected shape
+    # can be built once here, and the validator reduces to a direct comparison.
+    # This matters when constructing many small objects, e.g. one Cube per
+    # frame of a trajectory.
+    if all(item is None or isinstance(item, int) for item in shape_requirements):
+        static_shape = tuple(shape_requirements)
+
+        def static_validator(_obj, attribute, value):
+            observed_shape = value.shape if isinstance(value, np.ndarray) else (len(value),)
+            if len(observed_shape) == len(static_shape) and all(
+                es is None or es == os for es, os in zip(static_shape, observed_shape)
+            ):
+                return
+            raise TypeError(
+                f"Expecting shape {static_shape} for attribute {attribute.name}, "
+                f"got {observed_shape}"
+            )
+
+        return static_validator
 
     def validator(obj, attribute, value):
         # Build the expected shape, with the rules from the docstring.
@@ -32,10 +32,11 @@ from typing import TextIO
 from warnings import warn
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ..docstrings import document_dump_one, document_load_one
 from ..iodata import IOData
-from ..utils import LineIterator, LoadError, LoadWarning, set_four_index_element
+from ..utils import LineIterator, LoadError, LoadWarning, set_four_index_elements
 
 __all__ = ()
 
@@ -49,6 +50,40 @@ assumes they are stored in an FCIDUMP file in chemists' notation.
 """
 
 
+def _canonical_four_index_codes(indices: NDArray[int], nbasis: int) -> NDArray[int]:
+    """Encode four-index quadruples by the smallest code over their 8-fold symmetry orbit.
+
+    Parameters
+    ----------
+    indices
+        Four-index quadruples in physicists' notation.
+        shape=(nelement, 4), dtype=int
+    nbasis
+        The number of basis functions, i.e. the exclusive upper bound of the indices.
+
+    Returns
+    -------
+    One integer code per quadruple, equal for all quadruples related by the
+    8-fold index symmetry, shape=(nelement, ).
+
+    """
+    i0, i1, i2, i3 = (indices[:, axis].astype(np.int64) for axis in range(4))
+    equivalents = (
+        (i0, i1, i2, i3),
+        (i1, i0, i3, i2),
+        (i2, i1, i0, i3),
+        (i0, i3, i2, i1),
+        (i2, i3, i0, i1),
+        (i3, i2, i1, i0),
+        (i1, i2, i3, i0),
+        (i3, i0, i1, i2),
+    )
+    codes = np.stack(
+        [((ia * nbasis + ib) * nbasis + ic) * nbasis + id_ for ia, ib, ic, id_ in equivalents]
+    )
+    return codes.min(axis=0)
+
+
 @document_load_one(
     "Molpro 2012 FCIDUMP",
     ["core_energy", "one_ints", "nelec", "spinpol", "two_ints"],
@@ -82,6 +117,12 @@ def load_one(lit: LineIterator) -> dict:
     one_mo = np.zeros((nbasis, nbasis))
     two_mo = np.zeros((nbasis, nbasis, nbasis, nbasis))
     core_energy = 0.0
+    # The two-electron integrals are collected first and assigned with a single
+    # batched scatter after the loop, which is much faster than one
+    # Python-level assignment per line.
+    two_mo_indices = []
+    two_mo_values = []
+    two_mo_linenos = []
 
     for line in lit:
         words = line.split()
@@ -91,16 +132,13 @@ def load_one(lit: LineIterator) -> dict:
             )
         value = float(words[0])
         if words[3] != "0":
-            ii = int(words[1]) - 1
-            ij = int(words[2]) - 1
-            ik = int(words[3]) - 1
-            il = int(words[4]) - 1
-            if two_mo[ii, ik, ij, il] != 0.0:
-                warn(
-                    LoadWarning("Duplicate entries in the FCIDUMP file are ignored", lit),
-                    stacklevel=2,
-                )
-            set_four_index_element(two_mo, ii, ik, ij, il, value)
+            # Translate from chemists' to physicists' notation by swapping the
+            # middle two indices.
+            two_mo_indices.append(
+                (int(words[1]) - 1, int(words[3]) - 1, int(words[2]) - 1, int(words[4]) - 1)
+            )
+            two_mo_values.append(value)
+            two_mo_linenos.append(lit.lineno)
         elif words[1] != "0":
             ii = int(words[1]) - 1
             ij = int(words[2]) - 1
@@ -109,6 +147,29 @@ def load_one(lit: LineIterator) -> dict:
         else:
             core_energy = value
 
+    if two_mo_indices:
+        indices = np.array(two_mo_indices)
+        values = np.array(two_mo_values)
+        codes = _canonical_four_index_codes(indices, nbasis)
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        # All occurrences of an integral after its first one, in file order.
+        duplicate = np.zeros(len(codes), dtype=bool)
+        duplicate[order[1:]] = sorted_codes[1:] == sorted_codes[:-1]
+        if duplicate.any():
+            for lineno in np.array(two_mo_linenos)[duplicate]:
+                warn(
+                    LoadWarning("Duplicate entries in the FCIDUMP file are ignored", lit, lineno),
+                    stacklevel=2,
+                )
+            # Keep the last occurrence of each duplicated integral, consistent
+            # with a sequence of single-element assignments.
+            last = np.ones(len(sorted_codes), dtype=bool)
+            last[:-1] = sorted_codes[1:] != sorted_codes[:-1]
+            indices = indices[order[last]]
+            values = values[order[last]]
+        set_four_index_elements(two_mo, indices, values)
+
     return {
         "nelec": nelec,
         "spinpol": spinpol,
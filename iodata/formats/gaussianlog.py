@@ -31,7 +31,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..docstrings import document_load_one
-from ..utils import LineIterator, set_four_index_element
+from ..utils import LineIterator, set_four_index_elements
 
 __all__ = ()
 
@@ -133,16 +133,19 @@ def _load_fourindex_g09(lit: LineIterator, nbasis: int) -> NDArray[float]:
         next(lit)
     # Start reading elements until a line is encountered that does not start
     # with ' I='
+    indices = []
+    values = []
     for line in lit:
         if not line.startswith(" I="):
             break
         # print line[3:7], line[9:13], line[15:19], line[21:25], line[28:].replace('D', 'E')
-        i0 = int(line[3:7]) - 1
-        i1 = int(line[9:13]) - 1
-        i2 = int(line[15:19]) - 1
-        i3 = int(line[21:25]) - 1
-        value = float(line[29:].replace("D", "E"))
         # Gaussian uses the chemists' notation for the 4-center indexes. IOdata
-        # uses the physicists' notation.
-        set_four_index_element(result, i0, i2, i1, i3, value)
+        # uses the physicists' notation, hence the swap of the middle two.
+        indices.append(
+            (int(line[3:7]) - 1, int(line[15:19]) - 1, int(line[9:13]) - 1, int(line[21:25]) - 1)
+        )
+        values.append(float(line[29:].replace("D", "E")))
+    # One batched scatter is much faster than one Python-level assignment per line.
+    if indices:
+        set_four_index_elements(result, np.array(indices), np.array(values))
     return result
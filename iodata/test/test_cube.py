@@ -24,6 +24,7 @@ import numpy as np
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_one, load_one
+from ..utils import Cube
 
 
 def test_load_aelta():
@@ -51,6 +52,16 @@ def test_load_aelta():
     assert_allclose(pn[-1], mol.atnums[-1], atol=1.0e-10)
 
 
+def test_grid_points():
+    origin = np.array([0.25, -0.5, 1.0])
+    axes = np.array([[1.0, 0.1, 0.0], [0.0, 1.2, 0.0], [0.0, 0.0, 0.8]])
+    cube = Cube(origin=origin, axes=axes, data=np.zeros((2, 3, 4)))
+    points = cube.grid_points()
+    assert points.shape == (2, 3, 4, 3)
+    assert_allclose(points[0, 0, 0], origin, atol=1.0e-15)
+    assert_allclose(points[1, 2, 3], origin + axes[0] + 2 * axes[1] + 3 * axes[2], atol=1.0e-15)
+
+
 def test_load_dump_load_aelta(tmpdir):
     with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube1:
         mol1 = load_one(str(fn_cube1))
@@ -28,7 +28,7 @@ from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_one, load_many, load_one
 from ..overlap import compute_overlap
-from ..utils import PrepareDumpError, PrepareDumpWarning, check_dm
+from ..utils import PrepareDumpError, PrepareDumpWarning, _trace_product, check_dm
 from .common import (
     check_orthonormal,
     compare_mols,
@@ -313,7 +313,7 @@ def check_load_nitrogen(key, numbers, numbers_spin):
     check_orthonormal(mol.mo.coeffsa, olp)
     check_orthonormal(mol.mo.coeffsb, olp)
     check_dm(dm, olp, eps=1e-3, occ_max=2)
-    assert_allclose(np.einsum("ab,ba", olp, dm), 7.0, atol=1.0e-7, rtol=0)
+    assert_allclose(_trace_product(olp, dm), 7.0, atol=1.0e-7, rtol=0)
     dm_spin = mol.one_rdms["post_scf_spin_ao"]
     assert_equal(dm_spin[0, 0], numbers_spin[0])
     assert_equal(dm_spin[8, 8], numbers_spin[1])
@@ -342,7 +342,7 @@ def check_normalization_dm_azirine(key):
     check_orthonormal(mol.mo.coeffs, olp)
     dm = mol.one_rdms["post_scf_ao"]
     check_dm(dm, olp, eps=1e-2, occ_max=2)
-    assert_allclose(np.einsum("ab,ba", olp, dm), 22.0, atol=1.0e-8, rtol=0)
+    assert_allclose(_trace_product(olp, dm), 22.0, atol=1.0e-8, rtol=0)
 
 
 def test_normalization_dm_azirine_cc():
@@ -22,9 +22,11 @@ import os
 from importlib.resources import as_file, files
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_one, load_one
+from ..utils import LoadWarning
 
 
 def test_load_fcidump_psi4_h2():
@@ -102,3 +104,21 @@ def test_dump_load_fcidimp_consistency_ao(tmpdir):
     assert_equal(mol0.spinpol, mol1.spinpol)
     assert_allclose(mol0.one_ints["core_mo"], mol1.one_ints["core_mo"])
     assert_allclose(mol0.two_ints["two_mo"], mol1.two_ints["two_mo"])
+
+
+def test_load_fcidump_duplicates(tmpdir):
+    fn_tmp = os.path.join(tmpdir, "DUPS.FCIDUMP")
+    with open(fn_tmp, "w") as fh:
+        fh.write(" &FCI NORB=2,NELEC=2,MS2=0,\n  ORBSYM= 1,1,\n  ISYM=1\n &END\n")
+        # The second line repeats the first integral through its 8-fold
+        # symmetry, with a different value.
+        fh.write(" 1.0 1 2 1 2\n")
+        fh.write(" 2.0 2 1 2 1\n")
+        fh.write(" 0.5 1 1 0 0\n")
+        fh.write(" 0.25 0 0 0 0\n")
+    with pytest.warns(LoadWarning):
+        mol = load_one(fn_tmp)
+    # The last value must win, consistent with single-element assignments.
+    assert_allclose(mol.two_ints["two_mo"][0, 0, 1, 1], 2.0)
+    assert_allclose(mol.one_ints["core_mo"][0, 0], 0.5)
+    assert_allclose(mol.core_energy, 0.25)
@@ -27,7 +27,7 @@ from numpy.testing import assert_allclose, assert_equal
 
 from ..api import IOData, load_one
 from ..overlap import compute_overlap
-from ..utils import FileFormatError
+from ..utils import FileFormatError, _trace_product
 from .common import compute_1rdm
 
 
@@ -93,7 +93,7 @@ def test_dm_ch3_rohf_g03():
         mol = load_one(str(fn_fchk))
     olp = compute_overlap(mol.obasis, mol.atcoords)
     dm = compute_1rdm(mol)
-    assert_allclose(np.einsum("ab,ba", olp, dm), 9, atol=1.0e-6)
+    assert_allclose(_trace_product(olp, dm), 9, atol=1.0e-6)
 
 
 def test_charge_nelec1():
@@ -18,15 +18,169 @@
 # --
 """Unit tests for iodata.utils."""
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
-from ..utils import amu, strtobool
+from ..utils import (
+    LineIterator,
+    amu,
+    angstrom,
+    check_dm,
+    check_dms,
+    derive_naturals,
+    from_bohr_array,
+    set_four_index_element,
+    set_four_index_elements,
+    strtobool,
+)
 
 
 def test_amu():
     assert abs(amu * 1.008 - 1837.47) < 1e-1
 
 
+def test_from_bohr_array():
+    atcoords = np.array([[0.0, 1.0, -2.0], [3.5, 0.0, 1.25]])
+    result = from_bohr_array(atcoords, angstrom)
+    assert result is atcoords
+    assert_allclose(atcoords[0, 2], -2.0 / angstrom, atol=1e-15)
+
+
+@pytest.mark.parametrize("nbasis", [1, 2, 3, 4, 7])
+def test_derive_naturals(nbasis):
+    rng = np.random.default_rng(nbasis)
+    tmp = rng.standard_normal((nbasis, nbasis))
+    overlap = tmp @ tmp.T + nbasis * np.eye(nbasis)
+    tmp = rng.standard_normal((nbasis, nbasis))
+    dm = tmp @ tmp.T
+    coeffs, occs = derive_naturals(dm, overlap)
+    # The occupations must be sorted in ascending order.
+    assert (np.diff(occs) >= 0).all()
+    # The coefficients must be eigenvectors of dm @ overlap, orthonormal
+    # with respect to the overlap matrix.
+    assert_allclose(dm @ overlap @ coeffs, coeffs * occs, atol=1e-10)
+    assert_allclose(coeffs.T @ overlap @ coeffs, np.eye(nbasis), atol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "occs0",
+    [
+        [0.5],
+        [0.5, 0.5],
+        [0.7, 0.3],
+        [1.0, 0.5, 0.5],
+        [0.9, 0.9, 0.9],
+        # Near-degenerate (not exactly degenerate) pairs exercise the
+        # cross-product eigenvectors where they are most delicate.
+        [0.3, 0.3 + 1e-9, 0.9],
+        [0.2, 0.8, 0.8 + 1e-9],
+    ],
+)
+def test_derive_naturals_degenerate(occs0):
+    # Degenerate occupations exercise the fallbacks in the analytic tiny-matrix branch.
+    nbasis = len(occs0)
+    rng = np.random.default_rng(nbasis)
+    tmp = rng.standard_normal((nbasis, nbasis))
+    overlap = tmp @ tmp.T + nbasis * np.eye(nbasis)
+    evals, evecs = np.linalg.eigh(overlap)
+    # Construct orbitals orthonormal with respect to the overlap matrix.
+    orbs = evecs / np.sqrt(evals)
+    dm = (orbs * occs0) @ orbs.T
+    coeffs, occs = derive_naturals(dm, overlap)
+    assert_allclose(occs, np.sort(occs0), atol=1e-10)
+    # The eigenvector accuracy is limited by the separation of the
+    # near-degenerate pairs, hence the looser tolerance.
+    assert_allclose(dm @ overlap @ coeffs, coeffs * occs, atol=1e-8)
+    assert_allclose(coeffs.T @ overlap @ coeffs, np.eye(nbasis), atol=1e-8)
+
+
+# The second case is large enough to trigger the memory-mapped code path.
+@pytest.mark.parametrize("nline", [100, 50000])
+def test_line_iterator(tmpdir, nline):
+    filename = f"{tmpdir}/lines.txt"
+    lines = [f"line {iline} " + "#" * 20 + "\n" for iline in range(nline)]
+    with open(filename, "w") as fh:
+        fh.writelines(lines)
+    with LineIterator(filename) as lit:
+        first = next(lit)
+        assert lit.lineno == 1
+        lit.back(first)
+        assert lit.lineno == 0
+        assert list(lit) == lines
+
+
+def test_set_four_index_elements():
+    rng = np.random.default_rng(42)
+    nbasis = 5
+    # Keep only one index quadruple per symmetry orbit, as in actual integral
+    # files, because the write order of equivalent elements is unspecified.
+    orbits = {}
+    for row in rng.integers(0, nbasis, size=(30, 4)):
+        i0, i1, i2, i3 = row
+        key = min(
+            (i0, i1, i2, i3),
+            (i1, i0, i3, i2),
+            (i2, i1, i0, i3),
+            (i0, i3, i2, i1),
+            (i2, i3, i0, i1),
+            (i3, i2, i1, i0),
+            (i1, i2, i3, i0),
+            (i3, i0, i1, i2),
+        )
+        orbits.setdefault(key, row)
+    indices = np.array(list(orbits.values()))
+    values = rng.standard_normal(len(indices))
+    result1 = np.zeros((nbasis, nbasis, nbasis, nbasis))
+    for (i0, i1, i2, i3), value in zip(indices, values):
+        set_four_index_element(result1, i0, i1, i2, i3, value)
+    result2 = np.zeros((nbasis, nbasis, nbasis, nbasis))
+    set_four_index_elements(result2, indices, values)
+    assert_allclose(result2, result1, atol=0)
+
+
+@pytest.mark.parametrize("eps", [1e-2, 1e-8])
+def test_check_dm(eps):
+    overlap = np.eye(4)
+    check_dm(np.diag([0.1, 0.5, 0.9, 1.0]), overlap, eps=eps)
+    with pytest.raises(ValueError):
+        check_dm(np.diag([-0.1, 0.5, 0.9, 1.0]), overlap, eps=eps)
+    with pytest.raises(ValueError):
+        check_dm(np.diag([0.1, 0.5, 0.9, 1.1]), overlap, eps=eps)
+
+
+def test_check_dm_ill_conditioned():
+    # A valid density matrix must pass with the default eps, even for an
+    # overlap matrix with a diffuse-basis-style condition number of 1e8.
+    rng = np.random.default_rng(17)
+    nbasis = 50
+    tmp = np.linalg.qr(rng.standard_normal((nbasis, nbasis)))[0]
+    overlap = (tmp * np.logspace(0, -8, nbasis)) @ tmp.T
+    evals, evecs = np.linalg.eigh(overlap)
+    orbs = evecs / np.sqrt(evals)
+    occs0 = rng.uniform(0.0, 1.0, nbasis)
+    dm = (orbs * occs0) @ orbs.T
+    check_dm(dm, overlap)
+
+
+def test_check_dms():
+    rng = np.random.default_rng(7)
+    nbasis = 5
+    tmp = rng.standard_normal((nbasis, nbasis))
+    overlap = tmp @ tmp.T + nbasis * np.eye(nbasis)
+    evals, evecs = np.linalg.eigh(overlap)
+    orbs = evecs / np.sqrt(evals)
+    occs = rng.uniform(0.0, 1.0, (3, nbasis))
+    dms = np.einsum("ai,bi,ni->nab", orbs, orbs, occs)
+    check_dms(dms, overlap)
+    occs[1, 0] = -0.5
+    with pytest.raises(ValueError):
+        check_dms(np.einsum("ai,bi,ni->nab", orbs, orbs, occs), overlap)
+    occs[1, 0] = 1.5
+    with pytest.raises(ValueError):
+        check_dms(np.einsum("ai,bi,ni->nab", orbs, orbs, occs), overlap)
+
+
 def test_strtobool():
     assert strtobool("T") is True
     assert strtobool("false") is False
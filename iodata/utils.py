@@ -18,15 +18,24 @@
 # --
 """Utility functions module."""
 
+import math
+import mmap
+import os
 from io import TextIOBase
 from pathlib import Path
-from typing import Optional, TextIO, Union
+from typing import Final, Optional, TextIO, Union
 
 import attrs
 import numpy as np
 import scipy.constants as spc
 from numpy.typing import NDArray
-from scipy.linalg import eigh
+from scipy.linalg import LinAlgError, cholesky, eigh, eigvalsh, solve_triangular
+from scipy.linalg.lapack import dsyevd
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 from .attrutils import validate_shape
 
@@ -41,10 +50,13 @@ __all__ = (
     "DumpWarning",
     "PrepareDumpWarning",
     "Cube",
+    "from_bohr_array",
     "set_four_index_element",
+    "set_four_index_elements",
     "volume",
     "derive_naturals",
     "check_dm",
+    "check_dms",
     "strtobool",
 )
 
@@ -52,18 +64,51 @@ __all__ = (
 # The unit conversion factors below can be used as follows:
 # - Conversion to atomic units: distance = 5*angstrom
 # - Conversion from atomic units: print(distance/angstrom)
-angstrom: float = spc.angstrom / spc.value("atomic unit of length")
-electronvolt: float = 1 / spc.value("hartree-electron volt relationship")
+# When converting in a tight parser loop, rebind the factor to a local variable
+# first (e.g. ang = angstrom), as local lookups are about twice as fast as
+# module globals. Even better, collect values in an array and convert them all
+# at once, e.g. with from_bohr_array.
+# The CODATA values are resolved once here: every spc.value call is a dict
+# lookup into the CODATA table, which should never end up in a hot path.
+_BOHR_METER: Final[float] = spc.value("atomic unit of length")
+_HARTREE_EV: Final[float] = spc.value("hartree-electron volt relationship")
+_HARTREE_JOULE: Final[float] = spc.value("Hartree energy")
+_AU_SECOND: Final[float] = spc.value("atomic unit of time")
+_ELECTRON_MASS_KG: Final[float] = spc.value("electron mass")
+_AVOGADRO: Final[float] = spc.value("Avogadro constant")
+
+angstrom: Final[float] = spc.angstrom / _BOHR_METER
+electronvolt: Final[float] = 1 / _HARTREE_EV
 # Unit conversion for Gromacs gro files
-meter: float = 1 / spc.value("Bohr radius")
-nanometer: float = 1e-9 * meter
-second: float = 1 / spc.value("atomic unit of time")
-picosecond: float = 1e-12 * second
+meter: Final[float] = 1 / _BOHR_METER
+nanometer: Final[float] = 1e-9 * meter
+second: Final[float] = 1 / _AU_SECOND
+picosecond: Final[float] = 1e-12 * second
 # atomic mass unit (not atomic unit of mass!)
-amu: float = 1e-3 / (spc.value("electron mass") * spc.value("Avogadro constant"))
-kcalmol: float = 1e3 * spc.calorie / spc.value("Avogadro constant") / spc.value("Hartree energy")
-calmol: float = spc.calorie / spc.value("Avogadro constant") / spc.value("Hartree energy")
-kjmol: float = 1e3 / spc.value("Avogadro constant") / spc.value("Hartree energy")
+amu: Final[float] = 1e-3 / (_ELECTRON_MASS_KG * _AVOGADRO)
+kcalmol: Final[float] = 1e3 * spc.calorie / _AVOGADRO / _HARTREE_JOULE
+calmol: Final[float] = spc.calorie / _AVOGADRO / _HARTREE_JOULE
+kjmol: Final[float] = 1e3 / _AVOGADRO / _HARTREE_JOULE
+
+
+def from_bohr_array(arr: NDArray[float], unit: float) -> NDArray[float]:
+    """Convert an array of values in atomic units to the given unit, in place.
+
+    Parameters
+    ----------
+    arr
+        An array of values in atomic units. It will be overwritten.
+    unit
+        One of the unit conversion factors defined in this module, e.g. ``angstrom``.
+
+    Returns
+    -------
+    The converted array, which is the same object as the ``arr`` argument.
+
+    """
+    # A single in-place vectorized multiplication, instead of one Python-level
+    # division per element.
+    return np.multiply(arr, 1.0 / unit, out=arr)
 
 
 class LineIterator:
@@ -79,6 +124,12 @@ class LineIterator:
 
     """
 
+    __slots__ = ("_fh_next", "_mmap", "fh", "filename", "lineno", "stack")
+
+    # Files at least this large are memory-mapped instead of read through the
+    # buffered file handle, avoiding one copy from the OS page cache.
+    _MMAP_MIN_SIZE = 1 << 20
+
     def __init__(self, filename: str):
         """Initialize a LineIterator.
 
@@ -92,21 +143,63 @@ class LineIterator:
         self.fh = None
         self.lineno = 0
         self.stack = []
+        self._fh_next = None
+        self._mmap = None
 
     def __enter__(self):
-        self.fh = open(self.filename)
+        # A large buffer amortizes read syscalls over many lines. The encoding
+        # is fixed so the buffered and memory-mapped paths decode identically,
+        # independent of the locale.
+        self.fh = open(self.filename, buffering=1 << 20, encoding="utf-8")
+        # Cache the bound __next__ to avoid two attribute lookups per line.
+        self._fh_next = self.fh.__next__
+        try:
+            size = os.fstat(self.fh.fileno()).st_size
+        except (OSError, ValueError):
+            size = 0
+        if size >= self._MMAP_MIN_SIZE:
+            try:
+                self._mmap = mmap.mmap(self.fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not a regular file (e.g. a pipe); stick to the buffered handle.
+                self._mmap = None
+            else:
+                if hasattr(self._mmap, "madvise"):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+                self._fh_next = self._iter_mmap_lines().__next__
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
         self.fh.close()
 
+    def _iter_mmap_lines(self):
+        """Iterate over the decoded lines of the memory-mapped file."""
+        buffer = self._mmap
+        size = len(buffer)
+        find = buffer.find
+        pos = 0
+        while pos < size:
+            end = find(b"\n", pos) + 1
+            if end == 0:
+                end = size
+            line = buffer[pos:end].decode("utf-8")
+            pos = end
+            # Normalize Windows line endings, as the text-mode handle would.
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            yield line
+
     def __iter__(self):
         return self
 
     def __next__(self):
         """Return the next line and increase the lineno attribute by one."""
+        stack = self.stack
         self.lineno += 1
-        return self.stack.pop() if self.stack else next(self.fh)
+        return stack.pop() if stack else self._fh_next()
 
     def back(self, line):
         """Go back one line in the file and decrease the lineno attribute by one."""
@@ -235,7 +328,9 @@ class PrepareDumpWarning(BaseFileWarning):
     """Raised when an IOData object is made compatible with a format before dumping to a file."""
 
 
-@attrs.define
+# eq=False because the attrs-generated __eq__ would compare the grid data
+# elementwise, which is expensive and raises on truth-value evaluation.
+@attrs.define(eq=False)
 class Cube:
     """The volumetric data from a cube (or similar) file."""
 
@@ -251,10 +346,69 @@ class Cube:
     data: NDArray[float] = attrs.field(validator=validate_shape(None, None, None))
     """A (K, L, M) array of data on a uniform grid"""
 
-    @property
-    def shape(self):
-        """Shape of the rectangular grid."""
-        return self.data.shape
+    # A plain attribute instead of a property, so hot loops reading the shape
+    # do not go through a descriptor call and tuple creation on every access.
+    shape: tuple = attrs.field(init=False, default=None)
+    """Shape of the rectangular grid."""
+
+    def __attrs_post_init__(self):
+        self.shape = self.data.shape
+
+    def grid_points(self) -> NDArray[float]:
+        """Compute the Cartesian coordinates of all grid points.
+
+        Returns
+        -------
+        A (K, L, M, 3) array with the coordinates of the grid points, in the
+        same order as the ``data`` attribute.
+
+        """
+        # A single matrix product over all integer grid indices, instead of a
+        # triple Python loop over origin + i * axes[0] + j * axes[1] + k * axes[2].
+        indices = np.moveaxis(np.indices(self.shape), 0, -1)
+        return self.origin + indices @ self.axes
+
+
+# The 8-fold index symmetry of a four-index object in physicists' notation,
+# written as permutations of the positions of the four indices.
+_FOUR_INDEX_PERMUTATIONS = np.array(
+    [
+        [0, 1, 2, 3],
+        [1, 0, 3, 2],
+        [2, 1, 0, 3],
+        [0, 3, 2, 1],
+        [2, 3, 0, 1],
+        [3, 2, 1, 0],
+        [1, 2, 3, 0],
+        [3, 0, 1, 2],
+    ]
+)
+_PERM0, _PERM1, _PERM2, _PERM3 = _FOUR_INDEX_PERMUTATIONS.T
+
+
+if numba is not None:
+    # Compiled counterpart of the batched four-index assignment. This
+    # eliminates the interpreter dispatch per element, which dominates in the
+    # O(nbasis**4 / 8) loops of two-electron integral loaders. Only the
+    # batched form benefits: calling a compiled kernel per element from the
+    # interpreter would cost more in dispatch than the eight stores.
+
+    @numba.njit(cache=True, boundscheck=False, parallel=True)
+    def _set_four_index_elements_jit(four_index_object, indices, values):
+        for k in numba.prange(len(values)):
+            i0 = indices[k, 0]
+            i1 = indices[k, 1]
+            i2 = indices[k, 2]
+            i3 = indices[k, 3]
+            value = values[k]
+            four_index_object[i0, i1, i2, i3] = value
+            four_index_object[i1, i0, i3, i2] = value
+            four_index_object[i2, i1, i0, i3] = value
+            four_index_object[i0, i3, i2, i1] = value
+            four_index_object[i2, i3, i0, i1] = value
+            four_index_object[i3, i2, i1, i0] = value
+            four_index_object[i1, i2, i3, i0] = value
+            four_index_object[i3, i0, i1, i2] = value
 
 
 def set_four_index_element(
@@ -275,6 +429,9 @@ def set_four_index_element(
         The value of the matrix element to store.
 
     """
+    # Eight scalar stores are the fastest option for a single element: both a
+    # fancy-index write and a compiled kernel pay more per-call dispatch
+    # overhead than they save. Use set_four_index_elements for bulk loads.
     four_index_object[i0, i1, i2, i3] = value
     four_index_object[i1, i0, i3, i2] = value
     four_index_object[i2, i1, i0, i3] = value
@@ -285,6 +442,38 @@ def set_four_index_element(
     four_index_object[i3, i0, i1, i2] = value
 
 
+def set_four_index_elements(
+    four_index_object: NDArray[float], indices: NDArray[int], values: NDArray[float]
+):
+    """Assign a batch of values to a four index object, account for 8-fold index symmetry.
+
+    This function assumes physicists' notation.
+    It is the batched counterpart of :py:func:`set_four_index_element`,
+    replacing many Python-level calls by a single vectorized scatter.
+
+    Parameters
+    ----------
+    four_index_object
+        The four-index object. It will be written to.
+        shape=(nbasis, nbasis, nbasis, nbasis), dtype=float
+    indices
+        The indices to assign to, one (i0, i1, i2, i3) row per value.
+        shape=(nelement, 4), dtype=int
+    values
+        The values of the matrix elements to store.
+        shape=(nelement, ), dtype=float
+
+    """
+    idx = np.asarray(indices)
+    values = np.asarray(values)
+    if numba is not None:
+        _set_four_index_elements_jit(four_index_object, idx, values)
+        return
+    four_index_object[idx[:, _PERM0], idx[:, _PERM1], idx[:, _PERM2], idx[:, _PERM3]] = values[
+        :, None
+    ]
+
+
 def volume(cellvecs: NDArray[float]) -> float:
     """Calculate the (generalized) cell volume.
 
@@ -301,16 +490,262 @@ def volume(cellvecs: NDArray[float]) -> float:
     In case of 1D, the cell length.
 
     """
+    # The generic np.linalg and np.cross routines have microsecond-level
+    # dispatch overhead, which dominates for these tiny inputs. Use direct
+    # scalar arithmetic instead.
     nvecs = cellvecs.shape[0]
     if len(cellvecs.shape) == 1 or nvecs == 1:
-        return np.linalg.norm(cellvecs)
+        vec = cellvecs.ravel()
+        return math.sqrt(vec @ vec)
     if nvecs == 2:
-        return np.linalg.norm(np.cross(cellvecs[0], cellvecs[1]))
+        (a0, a1, a2), (b0, b1, b2) = cellvecs
+        cross0 = a1 * b2 - a2 * b1
+        cross1 = a2 * b0 - a0 * b2
+        cross2 = a0 * b1 - a1 * b0
+        return math.sqrt(cross0 * cross0 + cross1 * cross1 + cross2 * cross2)
     if nvecs == 3:
-        return np.linalg.det(cellvecs)
+        vec_a, vec_b, vec_c = cellvecs
+        return abs(
+            vec_a[0] * (vec_b[1] * vec_c[2] - vec_b[2] * vec_c[1])
+            - vec_a[1] * (vec_b[0] * vec_c[2] - vec_b[2] * vec_c[0])
+            + vec_a[2] * (vec_b[0] * vec_c[1] - vec_b[1] * vec_c[0])
+        )
     raise ValueError("Argument cellvecs should be of shape (x, 3), where x is in {1, 2, 3}")
 
 
+def _eigh_direct2(mat: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+    """Compute the analytic eigendecomposition of a symmetric (2, 2) matrix.
+
+    Parameters
+    ----------
+    mat
+        A symmetric matrix, shape=(2, 2).
+
+    Returns
+    -------
+    evals
+        The eigenvalues in ascending order, shape=(2, ).
+    evecs
+        The corresponding eigenvectors as columns, shape=(2, 2).
+
+    """
+    m00, m01, m11 = mat[0, 0], mat[0, 1], mat[1, 1]
+    half_trace = 0.5 * (m00 + m11)
+    radius = math.hypot(0.5 * (m00 - m11), m01)
+    evals = np.array([half_trace - radius, half_trace + radius])
+    if radius == 0.0:
+        return evals, np.eye(2)
+    # An eigenvector for the largest eigenvalue, from a row of mat - eval * identity.
+    if m01 != 0.0:
+        vx, vy = m01, half_trace + radius - m00
+    else:
+        vx, vy = (1.0, 0.0) if m00 > m11 else (0.0, 1.0)
+    norm = math.hypot(vx, vy)
+    vx, vy = vx / norm, vy / norm
+    return evals, np.array([[-vy, vx], [vx, vy]])
+
+
+def _evec_direct3(mat: NDArray[float], eval_: float) -> Optional[NDArray[float]]:
+    """Compute a normalized eigenvector of a symmetric (3, 3) matrix for a given eigenvalue.
+
+    The eigenvector is found as the cross product of two rows of ``mat - eval_ * identity``,
+    which spans the null space when the eigenvalue is non-degenerate.
+    Returns None when the eigenvalue is (nearly) degenerate.
+    """
+    rows = mat - eval_ * np.eye(3)
+    candidates = np.array(
+        [
+            np.cross(rows[0], rows[1]),
+            np.cross(rows[0], rows[2]),
+            np.cross(rows[1], rows[2]),
+        ]
+    )
+    norms = np.linalg.norm(candidates, axis=1)
+    best = norms.argmax()
+    if norms[best] <= 1e-12 * abs(rows).max() ** 2:
+        return None
+    return candidates[best] / norms[best]
+
+
+def _eigh_direct3(mat: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+    """Compute the analytic eigendecomposition of a symmetric (3, 3) matrix.
+
+    The eigenvalues are the roots of the characteristic cubic, obtained with the
+    trigonometric form of Cardano's formula.
+
+    Parameters
+    ----------
+    mat
+        A symmetric matrix, shape=(3, 3).
+
+    Returns
+    -------
+    evals
+        The eigenvalues in ascending order, shape=(3, ).
+    evecs
+        The corresponding eigenvectors as columns, shape=(3, 3).
+
+    """
+    qtr = mat.trace() / 3
+    shifted = mat - qtr * np.eye(3)
+    psq = (shifted * shifted).sum() / 6
+    if psq == 0.0:
+        # The matrix is a multiple of the identity.
+        return np.full(3, qtr), np.eye(3)
+    prad = math.sqrt(psq)
+    scaled = shifted / prad
+    half_det = 0.5 * (
+        scaled[0, 0] * (scaled[1, 1] * scaled[2, 2] - scaled[1, 2] * scaled[2, 1])
+        - scaled[0, 1] * (scaled[1, 0] * scaled[2, 2] - scaled[1, 2] * scaled[2, 0])
+        + scaled[0, 2] * (scaled[1, 0] * scaled[2, 1] - scaled[1, 1] * scaled[2, 0])
+    )
+    phi = math.acos(min(max(half_det, -1.0), 1.0)) / 3
+    high = qtr + 2 * prad * math.cos(phi)
+    low = qtr + 2 * prad * math.cos(phi + 2 * math.pi / 3)
+    evals = np.array([low, 3 * qtr - low - high, high])
+    if evals[2] - evals[0] <= 1e-12 * max(abs(evals[0]), abs(evals[2])):
+        return evals, np.eye(3)
+    # Compute the eigenvector of the most isolated extreme eigenvalue first,
+    # as it is the most accurate one.
+    iso, other = (0, 2) if evals[1] - evals[0] >= evals[2] - evals[1] else (2, 0)
+    vec_iso = _evec_direct3(mat, evals[iso])
+    if vec_iso is None:
+        # Ill-conditioned corner case: defer to LAPACK.
+        return eigh(mat)
+    vec_other = _evec_direct3(mat, evals[other])
+    if vec_other is not None:
+        # Orthogonalize against the first eigenvector to suppress rounding errors.
+        vec_other = vec_other - (vec_other @ vec_iso) * vec_iso
+        norm = np.linalg.norm(vec_other)
+        vec_other = None if norm <= 1e-6 else vec_other / norm
+    if vec_other is None:
+        # Degenerate pair: any direction orthogonal to vec_iso is an eigenvector.
+        vec_other = np.zeros(3)
+        vec_other[abs(vec_iso).argmin()] = 1.0
+        vec_other = vec_other - (vec_other @ vec_iso) * vec_iso
+        vec_other /= np.linalg.norm(vec_other)
+    evecs = np.zeros((3, 3))
+    evecs[:, iso] = vec_iso
+    evecs[:, other] = vec_other
+    evecs[:, 1] = np.cross(vec_iso, vec_other)
+    return evals, evecs
+
+
+def _eigh_direct(mat: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+    """Compute the eigendecomposition of a tiny symmetric matrix without LAPACK.
+
+    For matrices of size 1, 2 or 3, the closed-form solutions avoid the LAPACK
+    dispatch and workspace overhead, which dominates at these sizes.
+
+    Parameters
+    ----------
+    mat
+        A symmetric matrix, shape=(n, n) with n <= 3.
+
+    Returns
+    -------
+    evals
+        The eigenvalues in ascending order, shape=(n, ).
+    evecs
+        The corresponding eigenvectors as columns, shape=(n, n).
+
+    """
+    if len(mat) == 1:
+        return np.array([mat[0, 0]]), np.eye(1)
+    if len(mat) == 2:
+        return _eigh_direct2(mat)
+    return _eigh_direct3(mat)
+
+
+def _trace_product(op1: NDArray[float], op2: NDArray[float]) -> float:
+    """Compute the trace of the product of two matrices, without forming the product.
+
+    Parameters
+    ----------
+    op1
+        The first matrix, shape=(nbasis, nbasis).
+    op2
+        The second matrix, shape=(nbasis, nbasis).
+
+    Returns
+    -------
+    The trace of ``op1 @ op2``.
+
+    """
+    # Equivalent to np.einsum("ab,ba", op1, op2), but dispatches to a single
+    # BLAS dot product instead of the generic einsum kernel.
+    return float(np.vdot(op1, op2.T))
+
+
+def _reduce_dm(
+    dm: NDArray[float], overlap: NDArray[float]
+) -> tuple[NDArray[float], NDArray[float]]:
+    """Reduce the generalized natural-orbital eigenproblem to standard symmetric form.
+
+    The occupations are the eigenvalues of ``dm @ overlap``, which shares its
+    spectrum with the symmetric matrix ``L.T @ dm @ L``, where L is the lower
+    Cholesky factor of the overlap matrix. This avoids the slower generalized
+    LAPACK driver used by ``eigh(sds, overlap)``.
+
+    Parameters
+    ----------
+    dm
+        The density matrix.
+        shape=(nbasis, nbasis)
+    overlap
+        The overlap matrix
+        shape=(nbasis, nbasis)
+
+    Returns
+    -------
+    lower
+        The lower Cholesky factor of the overlap matrix.
+        shape=(nbasis, nbasis)
+    reduced
+        The symmetrized standard-form matrix ``L.T @ dm @ L``.
+        shape=(nbasis, nbasis)
+
+    """
+    lower = cholesky(overlap, lower=True, check_finite=False)
+    reduced = lower.T @ dm @ lower
+    # Symmetrize to suppress rounding errors before calling a symmetric solver.
+    return lower, 0.5 * (reduced + reduced.T)
+
+
+def _natural_occupations(dm: NDArray[float], overlap: NDArray[float]) -> NDArray[float]:
+    """Compute only the natural orbital occupations for a given density matrix.
+
+    Computing eigenvalues without eigenvectors is two to three times cheaper
+    than the full decomposition in :py:func:`derive_naturals`, and also skips
+    the back-transformation of the eigenvectors.
+
+    Parameters
+    ----------
+    dm
+        The density matrix.
+        shape=(nbasis, nbasis)
+    overlap
+        The overlap matrix
+        shape=(nbasis, nbasis)
+
+    Returns
+    -------
+    Orbital occupations, shape=(nbasis, ).
+
+    """
+    try:
+        reduced = _reduce_dm(dm, overlap)[1]
+    except LinAlgError:
+        # The overlap matrix is not suited for a Cholesky factorization.
+        # Fall back to the generalized eigenproblem, with multi_dot picking
+        # the cheapest order for the triple matrix product.
+        sds = np.linalg.multi_dot([overlap.T, dm, overlap])
+        return eigvalsh(sds, overlap)
+    if len(reduced) <= 3:
+        return _eigh_direct(reduced)[0]
+    return eigvalsh(reduced, driver="evr", overwrite_a=True, check_finite=False)
+
+
 def derive_naturals(
     dm: NDArray[float], overlap: NDArray[float]
 ) -> tuple[NDArray[float], NDArray[float]]:
@@ -335,13 +770,28 @@ def derive_naturals(
         shape=(nfn, )
 
     """
-    # Transform density matrix to Fock-like form
-    sds = np.dot(overlap.T, np.dot(dm, overlap))
-    # Diagonalize and compute eigenvalues
-    evals, evecs = eigh(sds, overlap)
-    coeffs = np.zeros_like(overlap)
-    coeffs = evecs[:, : coeffs.shape[1]]
-    occs = evals
+    try:
+        lower, reduced = _reduce_dm(dm, overlap)
+    except LinAlgError:
+        # The overlap matrix is not suited for a Cholesky factorization.
+        # Fall back to the generalized eigenproblem, with multi_dot picking
+        # the cheapest order for the triple matrix product.
+        sds = np.linalg.multi_dot([overlap.T, dm, overlap])
+        occs, coeffs = eigh(sds, overlap)
+        return coeffs, occs
+    if len(reduced) <= 3:
+        occs, evecs = _eigh_direct(reduced)
+    else:
+        # Call the LAPACK wrapper directly: the scipy.linalg.eigh frontend adds
+        # tens of microseconds of validation and marshalling per call, a sizable
+        # fraction of the total for small matrices.
+        occs, evecs, info = dsyevd(reduced, compute_v=1, lower=1, overwrite_a=1)
+        if info != 0:
+            raise LinAlgError(f"dsyevd failed to diagonalize the density matrix: info={info}")
+    # Back-transform the eigenvectors to the non-orthogonal basis. These
+    # coefficients are orthonormal with respect to the overlap matrix, just like
+    # the eigenvectors of the original generalized eigenproblem.
+    coeffs = solve_triangular(lower, evecs, lower=True, trans="T", check_finite=False)
     return coeffs, occs
 
 
@@ -367,8 +817,11 @@ def check_dm(dm: NDArray[float], overlap: NDArray[float], eps: float = 1e-4, occ
         When the density matrix has wrong eigenvalues.
 
     """
-    # construct natural orbitals
-    occupations = derive_naturals(dm, overlap)[1]
+    # Only the natural occupations are needed, not the orbitals themselves.
+    # Note that reduced (single) precision is not an option here, even for
+    # loose values of eps: the eigenvalue error grows with the condition
+    # number of the overlap matrix and exceeds eps for diffuse basis sets.
+    occupations = _natural_occupations(dm, overlap)
     if occupations.min() < -eps:
         raise ValueError(
             "The density matrix has eigenvalues considerably smaller than "
@@ -381,25 +834,63 @@ def check_dm(dm: NDArray[float], overlap: NDArray[float], eps: float = 1e-4, occ
         )
 
 
-STRTOBOOL = {
-    "y": True,
-    "yes": True,
-    "t": True,
-    "true": True,
-    "on": True,
-    "1": True,
-    "n": False,
-    "no": False,
-    "f": False,
-    "false": False,
-    "off": False,
-    "0": False,
-}
+def check_dms(
+    dms: NDArray[float], overlap: NDArray[float], eps: float = 1e-4, occ_max: float = 1.0
+):
+    """Check if a batch of density matrices has eigenvalues in the proper range.
+
+    This is the batched counterpart of :py:func:`check_dm` for multiple density
+    matrices sharing one overlap matrix, e.g. spin channels. The overlap matrix
+    is factorized only once and the Python overhead per density matrix is
+    amortized over the whole batch.
+
+    Parameters
+    ----------
+    dms
+        The density matrices.
+        shape=(ndm, nbasis, nbasis), dtype=float
+    overlap
+        The overlap matrix
+        shape=(nbasis, nbasis), dtype=float
+    eps
+        The threshold on the eigenvalue inequalities.
+    occ_max
+        The maximum occupation.
+
+    Raises
+    ------
+    ValueError
+        When one of the density matrices has wrong eigenvalues.
+
+    """
+    lower = cholesky(overlap, lower=True, check_finite=False)
+    # The matrix products broadcast over the leading (batch) axis.
+    reduced = lower.T @ dms @ lower
+    reduced = 0.5 * (reduced + reduced.swapaxes(-1, -2))
+    occupations = np.linalg.eigvalsh(reduced)
+    if occupations.min() < -eps:
+        raise ValueError(
+            "A density matrix has eigenvalues considerably smaller than "
+            f"zero. error={occupations.min():e}"
+        )
+    if occupations.max() > occ_max + eps:
+        raise ValueError(
+            "A density matrix has eigenvalues considerably larger than "
+            "max. error=%e" % (occupations.max() - 1)
+        )
+
+
+_STRTOBOOL_TRUE = frozenset(("y", "yes", "t", "true", "on", "1"))
+_STRTOBOOL_FALSE = frozenset(("n", "no", "f", "false", "off", "0"))
 
 
 def strtobool(value: str) -> bool:
     """Interpret string as a boolean."""
-    result = STRTOBOOL.get(value.lower())
-    if result is None:
-        raise ValueError(f"'{value}' cannot be converted to boolean")
-    return result
+    # Most boolean flags in actual files are already lowercase, in which case
+    # the allocation of a new lowercase string can be skipped.
+    lowered = value if value.islower() else value.lower()
+    if lowered in _STRTOBOOL_TRUE:
+        return True
+    if lowered in _STRTOBOOL_FALSE:
+        return False
+    raise ValueError(f"'{value}' cannot be converted to boolean")